@@ -22,15 +22,15 @@ Attributes:
 
 """
 
+import heapq
+import itertools
 import logging
 from functools import wraps
-from typing import Iterable, Iterator, Optional, TypeVar, Union
+from typing import Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
 from typing_extensions import Protocol
 
 from intervaltree import Interval, IntervalTree
 
-from .fibonacci import FibonacciHeap
-
 
 log = logging.getLogger(__name__)
 
@@ -113,6 +113,9 @@ RangeValue = Union[int, Infinity]
 
 class Range:
     """An integer range."""
+
+    __slots__ = ('lower_bound', 'upper_bound')
+
     def __init__(self, lower_bound: RangeValue = NEGATIVE_INFINITY, upper_bound: RangeValue = POSITIVE_INFINITY):
         """Constructs a range.
 
@@ -218,6 +221,22 @@ class Range:
         return f"[{self.lower_bound!s}, {self.upper_bound!s}]"
 
 
+class FrozenRange(Range):
+    """A :class:`Range` whose bounds cannot be changed after construction.
+
+    This is used for ranges that are shared, *e.g.*, between every call to the :meth:`Bounded.bounds` of an object whose
+    bounds never change.
+
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        if hasattr(self, name):
+            raise AttributeError(f"Cannot change the {name} of {self!r}")
+        super().__setattr__(name, value)
+
+
 class Bounded(Protocol):
     """A protocol for objects that have bounds that can be tightened."""
 
@@ -231,7 +250,12 @@ class Bounded(Protocol):
         raise NotImplementedError(f"Class {self.__class__.__name__} must implement tighten_bounds")
 
     def bounds(self) -> Range:
-        """Returns the bounds of this object."""
+        """Returns the bounds of this object.
+
+        The returned range might be shared with other callers (*e.g.*, it might be a :class:`FrozenRange`), so callers
+        must not modify it.
+
+        """
         raise NotImplementedError(f"Class {self.__class__.__name__} must implement bounds")
 
 
@@ -268,7 +292,7 @@ class ConstantBound(Bounded):
             value: The constant value of the object, which will constitute both its lower and upper bound.
 
         """
-        self._range = Range(value, value)
+        self._range = FrozenRange(value, value)
 
     def bounds(self) -> Range:
         """Returns a :class:`Range` where both the lower and upper bounds are equal to this object's constant value."""
@@ -329,9 +353,11 @@ class BoundedComparator:
     def __le__(self, other):
         if self < other:
             return True
-        while self.bounded.tighten_bounds() or other.bounded.tighten_bounds():
-            pass
-        return self.bounded.bounds() == other.bounded.bounds()
+        while not other.bounded.bounds().upper_bound < self.bounded.bounds().lower_bound:
+            if not (self.bounded.tighten_bounds() or other.bounded.tighten_bounds()):
+                return self.bounded.bounds() == other.bounded.bounds()
+        # The ranges are disjoint, so no amount of tightening will make them equal
+        return False
 
 
 B = TypeVar('B', bound=Bounded)
@@ -346,21 +372,29 @@ def sort(items: Iterable[B]) -> Iterator[B]:
     Returns:
         Iterator[B]: An iterator over the sorted sequence of items.
 
-    This is equivalent to::
-
-        heap: FibonacciHeap[B, BoundedComparator] = FibonacciHeap(key=BoundedComparator)
-        for item in items:
-            heap.push(item)
-        while heap:
-            yield heap.pop()
-
+    The items are stored in a binary heap of ``(lower_bound, sequence_number, item)`` tuples, so sifting the heap only
+    ever compares integers and never causes any item to be tightened. The item with the smallest lower bound is popped.
+    If its upper bound is no greater than the lower bound of every remaining item, then it is the smallest and it is
+    yielded. Otherwise, it is tightened and pushed back onto the heap with its new lower bound (or, if it cannot be
+    tightened any further, its closest competitor is tightened instead).
 
     """
-    heap: FibonacciHeap[B, BoundedComparator] = FibonacciHeap(key=BoundedComparator)
-    for item in items:
-        heap.push(item)
+    sequence = itertools.count()
+    heap: List[Tuple[RangeValue, int, B]] = [(item.bounds().lower_bound, next(sequence), item) for item in items]
+    heapq.heapify(heap)
     while heap:
-        yield heap.pop()
+        _, _, item = heapq.heappop(heap)
+        if heap and item.bounds().upper_bound > heap[0][0]:
+            # `item` might not be the smallest remaining item
+            if item.tighten_bounds():
+                heapq.heappush(heap, (item.bounds().lower_bound, next(sequence), item))
+                continue
+            lb, _, competitor = heap[0]
+            if competitor.tighten_bounds() or competitor.bounds().lower_bound > lb:
+                heapq.heapreplace(heap, (competitor.bounds().lower_bound, next(sequence), competitor))
+                heapq.heappush(heap, (item.bounds().lower_bound, next(sequence), item))
+                continue
+        yield item
 
 
 def min_bounded(bounds: Iterator[B]) -> B:
@@ -381,12 +415,21 @@ def min_bounded(bounds: Iterator[B]) -> B:
 def make_distinct(*bounded: Bounded):
     """Ensures that all of the provided bounded arguments are tightened until they are finite and
     either definitive or non-overlapping with any of the other arguments."""
-    tree: IntervalTree = IntervalTree()
     for b in bounded:
         if not b.bounds().finite:
             b.tighten_bounds()
             if not b.bounds().finite:
                 raise ValueError(f"Could not tighten {b!r} to a finite bound")
+    # Fast path: check whether the ranges are already distinct before building the interval tree. When sorted by lower
+    # bound, it suffices to check that each range is distinct from the next.
+    ranges = sorted((b.bounds() for b in bounded), key=lambda r: r.lower_bound)
+    if all(
+        r1.upper_bound < r2.lower_bound or (r1.definitive() and r2.definitive())
+        for r1, r2 in zip(ranges, ranges[1:])
+    ):
+        return
+    tree: IntervalTree = IntervalTree()
+    for b in bounded:
         tree.add(Interval(b.bounds().lower_bound, b.bounds().upper_bound + 1, b))
     while len(tree) > 1:
         # find the biggest interval in the tree
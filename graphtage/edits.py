@@ -1,10 +1,11 @@
-import itertools
 from abc import abstractmethod, ABC
-from typing import Any, Callable, cast, Collection, Generic, Iterator, List, Optional, Type, TypeVar
+from collections import deque
+from weakref import WeakValueDictionary
+from typing import Any, Callable, cast, Collection, Deque, Generic, Iterator, List, Optional, Tuple, Type, TypeVar
 
 from .printer import Back, Fore, Printer
 from .search import IterativeTighteningSearch
-from .bounds import Range
+from .bounds import FrozenRange, Range, RangeValue
 from .tree import CompoundEdit, Edit, EditedTreeNode, GraphtageFormatter, TreeNode
 
 
@@ -112,6 +113,8 @@ class ConstantCostEdit(AbstractEdit, ABC):
             cost: The constant cost of the edit.
 
         """
+        # The bounds of this edit never change, so only construct them once
+        self._bounds: Range = FrozenRange(cost, cost)
         super().__init__(
             from_node=from_node,
             to_node=to_node,
@@ -119,6 +122,9 @@ class ConstantCostEdit(AbstractEdit, ABC):
             cost_upper_bound=cost
         )
 
+    def bounds(self) -> Range:
+        return self._bounds
+
     def tighten_bounds(self) -> bool:
         """This always returns :const:`False`"""
         return False
@@ -227,6 +233,8 @@ class PossibleEdits(AbstractCompoundEdit):
 class Match(ConstantCostEdit):
     """A constant cost edit specifying that one node should be matched to another."""
 
+    _zero_cost_matches: 'WeakValueDictionary[Tuple[int, int], Match]' = WeakValueDictionary()
+
     def __init__(self, match_from: TreeNode, match_to: TreeNode, cost: int):
         super().__init__(
             from_node=match_from,
@@ -234,6 +242,21 @@ class Match(ConstantCostEdit):
             cost=cost
         )
 
+    @staticmethod
+    def zero_cost(match_from: TreeNode, match_to: TreeNode) -> 'Match':
+        """Returns a match with zero cost from one node to another.
+
+        The same pairs of identical nodes are matched repeatedly over the course of a diff, so rather than constructing
+        a new edit each time, a single instance is shared for each pair of nodes for as long as it is in use.
+
+        """
+        key = (id(match_from), id(match_to))
+        match = Match._zero_cost_matches.get(key)
+        if match is None:
+            match = Match(match_from, match_to, 0)
+            Match._zero_cost_matches[key] = match
+        return match
+
     def on_diff(self, from_node: EditedTreeNode):
         super().on_diff(from_node)
         from_node.matched_to = self.to_node
@@ -369,7 +392,16 @@ class EditCollection(AbstractCompoundEdit, Generic[C]):
             explode_edits: bool = True
     ):
         self._edit_iter: Iterator[Edit] = edits
+        # Iterators over the sub-edits of exploded compound edits, to be expanded once `self._edit_iter` is exhausted
+        self._exploded_edit_iters: Deque[Iterator[Edit]] = deque()
         self._sub_edits: C[Edit] = collection()
+        # Running totals of the sub-edits' bounds, so that calculating our bounds does not require summing over every
+        # sub-edit. `self._observed` holds each sub-edit (in the order it was expanded) along with the lower and upper
+        # bound that it is currently contributing to the totals.
+        self._observed: List[Tuple[Edit, RangeValue, RangeValue]] = []
+        self._lower_bound_total: RangeValue = 0
+        self._upper_bound_total: RangeValue = 0
+        self._initial_upper_bound_total: RangeValue = 0
         cost_upper_bound = from_node.total_size + 1
         if to_node is not None:
             cost_upper_bound += to_node.total_size
@@ -403,20 +435,47 @@ class EditCollection(AbstractCompoundEdit, Generic[C]):
             sub_edit.print(formatter, printer)
 
     def _expand_edits(self) -> Optional[Edit]:
-        if self._edit_iter is not None:
+        while self._edit_iter is not None:
             try:
                 next_edit = next(self._edit_iter)
-                self._cost = None
-                if self.explode_edits and isinstance(next_edit, CompoundEdit):
-                    self._edit_iter = itertools.chain(self._edit_iter, next_edit.edits())
-                    return self._expand_edits()
-                else:
-                    self._add(next_edit)
-                    return next_edit
             except StopIteration:
-                self._edit_iter = None
+                if self._exploded_edit_iters:
+                    self._edit_iter = self._exploded_edit_iters.popleft()
+                else:
+                    self._edit_iter = None
+                continue
+            self._cost = None
+            if self.explode_edits and isinstance(next_edit, CompoundEdit):
+                # Expand the compound edit's sub-edits after the remainder of the current edits. Queueing them (rather
+                # than chaining them onto `self._edit_iter` and recursing) avoids building an ever-deeper nest of
+                # iterators, and hitting the recursion limit, when exploding many compound edits.
+                self._exploded_edit_iters.append(iter(next_edit.edits()))
+                continue
+            self._add(next_edit)
+            bounds = next_edit.bounds()
+            self._observed.append((next_edit, bounds.lower_bound, bounds.upper_bound))
+            self._lower_bound_total += bounds.lower_bound
+            self._upper_bound_total += bounds.upper_bound
+            self._initial_upper_bound_total += next_edit.initial_bounds.upper_bound
+            return next_edit
         return None
 
+    def _update_totals(self, index: int) -> bool:
+        """Updates the running totals with the current bounds of the sub-edit at :obj:`index` in the expansion order.
+
+        Returns:
+            bool: :const:`True` if the sub-edit's bounds changed since they were last observed.
+
+        """
+        edit, lower_bound, upper_bound = self._observed[index]
+        bounds = edit.bounds()
+        if bounds.lower_bound == lower_bound and bounds.upper_bound == upper_bound:
+            return False
+        self._lower_bound_total += bounds.lower_bound - lower_bound
+        self._upper_bound_total += bounds.upper_bound - upper_bound
+        self._observed[index] = (edit, bounds.lower_bound, bounds.upper_bound)
+        return True
+
     def edits(self) -> Iterator[Edit]:
         yield from iter(self._sub_edits)
         while True:
@@ -437,8 +496,9 @@ class EditCollection(AbstractCompoundEdit, Generic[C]):
             if self._expand_edits() and self._is_tightened(starting_bounds):
                 return True
             tightened = False
-            for child in self._sub_edits:
+            for index, (child, _, _) in enumerate(self._observed):
                 if child.tighten_bounds():
+                    self._update_totals(index)
                     self._cost = None
                     if not child.valid:
                         self.valid = False
@@ -452,6 +512,9 @@ class EditCollection(AbstractCompoundEdit, Generic[C]):
                         return True
                 else:
                     assert not child.valid or child.bounds().definitive()
+                    if self._update_totals(index):
+                        # The child was tightened elsewhere since we last observed it
+                        self._cost = None
             if not tightened and self._edit_iter is None:
                 return self._is_tightened(starting_bounds)
 
@@ -461,14 +524,13 @@ class EditCollection(AbstractCompoundEdit, Generic[C]):
         if self._cost is not None:
             return self._cost
         elif self._edit_iter is None:
-            # We've expanded all of the sub-edits, so calculate the bounds explicitly:
-            total_cost = sum(e.bounds() for e in self._sub_edits)
+            # We've expanded all of the sub-edits, so the bounds are exactly their running totals:
+            total_cost = Range(self._lower_bound_total, self._upper_bound_total)
         else:
             # We have not yet expanded all of the sub-edits
             total_cost = Range(0, self._cost_upper_bound)
-            for e in self._sub_edits:
-                total_cost.lower_bound += e.bounds().lower_bound
-                total_cost.upper_bound -= e.initial_bounds.upper_bound - e.bounds().upper_bound
+            total_cost.lower_bound += self._lower_bound_total
+            total_cost.upper_bound -= self._initial_upper_bound_total - self._upper_bound_total
         if total_cost.lower_bound > super().bounds().upper_bound:
             self.valid = False
             return Range()
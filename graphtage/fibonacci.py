@@ -8,7 +8,7 @@ Fibonacci Heap that has amortized constant time insertion.
 
 """
 
-from typing import Callable, Generic, Iterator, Optional, TypeVar
+from typing import Callable, Generic, Iterator, List, Optional, Tuple, TypeVar
 
 T = TypeVar('T')
 Key = TypeVar('Key')
@@ -112,15 +112,17 @@ class HeapNode(Generic[T, Key]):
 
     def __iter__(self) -> Iterator['HeapNode[T, Key]']:
         """Iterates over all of this node's descendants, including itself."""
-        yield self
-        if self.child:
-            yield from iter(self.child)
-        node = self.right
-        while node != self:
+        # This is a pre-order traversal using an explicit stack rather than recursing through nested generators, each
+        # of which would add overhead to every node yielded beneath it. Each stack entry is the next node to visit in a
+        # ring of siblings, along with the node at which that ring started.
+        stack: List[Tuple[HeapNode[T, Key], HeapNode[T, Key]]] = [(self, self)]
+        while stack:
+            node, start = stack.pop()
             yield node
+            if node.right is not start:
+                stack.append((node.right, start))
             if node.child is not None:
-                yield from iter(node.child)
-            node = node.right
+                stack.append((node.child, node.child))
 
     def __lt__(self, other):
         return (self.deleted and not other.deleted) or self.key < other.key
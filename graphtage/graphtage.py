@@ -7,7 +7,7 @@ from typing import Any, Collection, Dict, Generic, Iterable, Iterator, List, Opt
 from .bounds import Range
 from .edits import AbstractEdit, EditCollection
 from .edits import Insert, Match, Remove, Replace, AbstractCompoundEdit
-from .levenshtein import EditDistance, levenshtein_distance
+from .levenshtein import EditDistance, levenshtein_distance, LinearSpaceEditDistance
 from .multiset import MultiSetEdit
 from .printer import Back, Fore, NullANSIContext, Printer
 from .sequences import FixedLengthSequenceEdit, SequenceEdit, SequenceNode
@@ -26,6 +26,8 @@ class LeafNode(TreeNode):
 
         """
         self.object = obj
+        # Leaves are compared by their string representations, so only calculate it once
+        self._str: str = str(obj)
 
     def to_obj(self):
         """Returns the object wrapped by this node.
@@ -59,11 +61,14 @@ class LeafNode(TreeNode):
             int: The length of the string representation of :obj:`self.object`.
 
         """
-        return len(str(self.object))
+        return len(self._str)
 
     def edits(self, node: TreeNode) -> Edit:
         if isinstance(node, LeafNode):
-            return Match(self, node, levenshtein_distance(str(self.object), str(node.object)))
+            if self._str == node._str:
+                # This is by far the most common case, and requires no edit distance calculation
+                return Match.zero_cost(self, node)
+            return Match(self, node, levenshtein_distance(self._str, node._str))
         elif isinstance(node, ContainerNode):
             return Replace(self, node)
 
@@ -85,12 +90,12 @@ class LeafNode(TreeNode):
             try:
                 return self.object < other.object
             except TypeError:
-                return str(self.object) < str(other.object)
+                return self._str < other._str
         else:
             try:
                 return self.object < other
             except TypeError:
-                return str(self.object) < str(other)
+                return self._str < str(other)
 
     def __eq__(self, other):
         if isinstance(other, LeafNode):
@@ -105,7 +110,7 @@ class LeafNode(TreeNode):
         return f"{self.__class__.__name__}({self.object!r})"
 
     def __str__(self):
-        return str(self.object)
+        return self._str
 
 
 class KeyValuePairEdit(AbstractCompoundEdit):
@@ -127,13 +132,13 @@ class KeyValuePairEdit(AbstractCompoundEdit):
 
         """
         if from_kvp.key == to_kvp.key:
-            self.key_edit: Edit = Match(from_kvp.key, to_kvp.key, 0)
+            self.key_edit: Edit = Match.zero_cost(from_kvp.key, to_kvp.key)
         elif from_kvp.allow_key_edits:
             self.key_edit: Edit = from_kvp.key.edits(to_kvp.key)
         else:
             raise ValueError("Keys must match!")
         if from_kvp.value == to_kvp.value:
-            self.value_edit: Edit = Match(from_kvp.value, to_kvp.value, 0)
+            self.value_edit: Edit = Match.zero_cost(from_kvp.value, to_kvp.value)
         else:
             self.value_edit: Edit = from_kvp.value.edits(to_kvp.value)
         super().__init__(
@@ -311,7 +316,7 @@ class ListNode(SequenceNode[Tuple[T, ...]], Generic[T]):
     def edits(self, node: TreeNode) -> Edit:
         if isinstance(node, ListNode):
             if self._children == node._children:
-                return Match(self, node, 0)
+                return Match.zero_cost(self, node)
             elif not self.allow_list_edits or (len(self._children) == len(node._children) and (
                 not self.allow_list_edits_when_same_length or len(self._children) == 1
             )):
@@ -353,9 +358,9 @@ class MultiSetNode(SequenceNode[HashableCounter[T]], Generic[T]):
     def edits(self, node: TreeNode) -> Edit:
         if isinstance(node, MultiSetNode):
             if len(self._children) == len(node._children) == 0:
-                return Match(self, node, 0)
+                return Match.zero_cost(self, node)
             elif self._children == node._children:
-                return Match(self, node, 0)
+                return Match.zero_cost(self, node)
             else:
                 return MultiSetEdit(self, node, self._children, node._children)
         else:
@@ -551,7 +556,7 @@ class FixedKeyDictNode(MappingNode, SequenceNode[Dict[LeafNode, KeyValuePairNode
             if key in node:
                 other_kvp = node[key]
                 if kvp == other_kvp:
-                    yield Match(kvp, other_kvp, 0)
+                    yield Match.zero_cost(kvp, other_kvp)
                 else:
                     yield KeyValuePairEdit(kvp, other_kvp)
             else:
@@ -565,9 +570,9 @@ class FixedKeyDictNode(MappingNode, SequenceNode[Dict[LeafNode, KeyValuePairNode
     def edits(self, node: TreeNode) -> Edit:
         if isinstance(node, MappingNode):
             if len(self._children) == len(node) == 0:
-                return Match(self, node, 0)
+                return Match.zero_cost(self, node)
             elif frozenset(self) == frozenset(node):
-                return Match(self, node, 0)
+                return Match.zero_cost(self, node)
             else:
                 return FixedKeyDictNodeEdit(from_node=self, to_node=node, edits=self._child_edits(node))
         else:
@@ -800,7 +805,7 @@ class StringNode(LeafNode):
     def edits(self, node: TreeNode) -> Edit:
         if isinstance(node, StringNode):
             if self.object == node.object:
-                return Match(self, node, 0)
+                return Match.zero_cost(self, node)
             elif len(self.object) == 1 and len(node.object) == 1:
                 return Match(self, node, 1)
             return StringEdit(self, node)
@@ -832,7 +837,11 @@ class BoolNode(LeafNode):
         super().__init__(bool_like)
 
 
-def string_edit_distance(s1: str, s2: str) -> EditDistance:
+LINEAR_SPACE_STRING_EDIT_THRESHOLD: int = 4096
+"""Strings whose Levenshtein matrix would have more cells than this are diffed in linear space"""
+
+
+def string_edit_distance(s1: str, s2: str) -> SequenceEdit:
     """A convenience function for computing the edit distance between two strings.
 
     This is equivalent to::
@@ -841,16 +850,23 @@ def string_edit_distance(s1: str, s2: str) -> EditDistance:
         list2 = ListNode([StringNode(c) for c in s2])
         return EditDistance(list1, list2, list1.children(), list2.children(), insert_remove_penalty=0)
 
+    unless the strings are long enough that their Levenshtein matrix would have more than
+    :obj:`LINEAR_SPACE_STRING_EDIT_THRESHOLD` cells, in which case a
+    :class:`graphtage.levenshtein.LinearSpaceEditDistance` is returned instead.
+
     Args:
         s1: the string to compare from
         s2: the string to compare to
 
     Returns:
-        EditDistance: The :class:`graphtage.levenshtein.EditDistance` edit object for the strings.
+        SequenceEdit: The :class:`graphtage.levenshtein.EditDistance` or
+        :class:`graphtage.levenshtein.LinearSpaceEditDistance` edit object for the strings.
 
     """
     list1 = ListNode([StringNode(c) for c in s1])
     list2 = ListNode([StringNode(c) for c in s2])
+    if len(s1) * len(s2) > LINEAR_SPACE_STRING_EDIT_THRESHOLD:
+        return LinearSpaceEditDistance(list1, list2, list1.children(), list2.children())
     return EditDistance(list1, list2, list1.children(), list2.children(), insert_remove_penalty=0)
 
 
@@ -8,6 +8,7 @@
 import json
 import json5
 import os
+import sys
 from typing import Optional, Union
 
 from .graphtage import BoolNode, BuildOptions, DictNode, Filetype, FixedKeyDictNode, \
@@ -58,8 +59,10 @@ def build_tree(
             allow_list_edits_when_same_length=options.allow_list_edits_when_same_length
         )
     elif isinstance(python_obj, dict):
+        # Intern the keys, since the same keys recur throughout both files being diffed, and equal interned
+        # strings compare by identity:
         dict_items = {
-            build_tree(k, options=options, force_leaf_node=True):
+            build_tree(sys.intern(k) if isinstance(k, str) else k, options=options, force_leaf_node=True):
                 build_tree(v, options=options) for k, v in python_obj.items()
         }
         if options is None or options.allow_key_edits:
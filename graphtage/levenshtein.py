@@ -16,9 +16,15 @@ optimal edit sequence is discovered.
 
 import itertools
 import logging
-from typing import Iterator, List, Optional, Sequence, Tuple
+from array import array
+from functools import lru_cache
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
+try:
+    from rapidfuzz.distance import Levenshtein as RapidFuzzLevenshtein
+except ImportError:
+    RapidFuzzLevenshtein = None
 
 from .bounds import make_distinct, Range
 from .edits import Insert, Match, Remove
@@ -31,39 +37,352 @@ from .tree import Edit, TreeNode
 log = logging.getLogger(__name__)
 
 
-def levenshtein_distance(s: str, t: str) -> int:
+def levenshtein_distance(s: Sequence[Hashable], t: Sequence[Hashable]) -> int:
     """Canonical implementation of the Levenshtein distance metric.
 
+    If the optional `RapidFuzz`_ package is installed, its vectorized implementation is used. Otherwise, this falls back
+    to a pure Python implementation.
+
+    The same pairs of leaves tend to be compared many times over the course of a diff, so distances between pairs of
+    :class:`str` are memoized.
+
+    .. _RapidFuzz:
+        https://github.com/maxbachmann/RapidFuzz
+
     Args:
-        s: the string from which to match
-        t: the string to which to match
+        s: the string (or other sequence of hashable items) from which to match
+        t: the string (or other sequence of hashable items) to which to match
 
     Returns:
-        int: The Levenshtein edit distance metric between the two strings.
+        int: The Levenshtein edit distance metric between the two sequences.
+
+    """
+    if isinstance(s, str) and isinstance(t, str):
+        return _memoized_levenshtein_distance(s, t)
+    return _uncached_levenshtein_distance(s, t)
+
+
+@lru_cache(maxsize=2**16)
+def _memoized_levenshtein_distance(s: str, t: str) -> int:
+    return _uncached_levenshtein_distance(s, t)
+
+
+def _uncached_levenshtein_distance(s: Sequence[Hashable], t: Sequence[Hashable]) -> int:
+    if RapidFuzzLevenshtein is not None:
+        return RapidFuzzLevenshtein.distance(s, t)
+    return _levenshtein_distance(s, t)
+
+
+def _levenshtein_distance(s: Sequence[Hashable], t: Sequence[Hashable]) -> int:
+    if len(s) > len(t):
+        # The distance is symmetric, so always make `s` the shorter string
+        s, t = t, s
+    if not s:
+        return len(t)
+    elif len(s) <= 64:
+        return _bit_parallel_levenshtein_distance(s, t)
+    # The rows are as long as the second argument, so iterate over the longer string to keep the rows short
+    return int(_last_levenshtein_row(t, s)[-1])
+
+
+def _bit_parallel_levenshtein_distance(s: Sequence[Hashable], t: Sequence[Hashable]) -> int:
+    """Myers' bit-parallel algorithm for the Levenshtein distance, as generalized by Hyyrö.
+
+    Each column of the Levenshtein matrix is encoded as a pair of bit vectors representing its vertical deltas, so each
+    character of :obj:`t` is processed in a constant number of bitwise operations. This is fastest when the vectors fit
+    in a machine word, *i.e.*, when :obj:`s` has at most 64 characters.
 
     """
+    m = len(s)
+    mask = (1 << m) - 1
+    last_bit = 1 << (m - 1)
+    peq: Dict[Hashable, int] = {}
+    for i, c in enumerate(s):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    vp = mask
+    vn = 0
+    score = m
+    for c in t:
+        eq = peq.get(c, 0)
+        xv = eq | vn
+        xh = ((((eq & vp) + vp) & mask) ^ vp) | eq
+        hp = (vn | ~(xh | vp)) & mask
+        hn = vp & xh
+        if hp & last_bit:
+            score += 1
+        elif hn & last_bit:
+            score -= 1
+        hp = ((hp << 1) | 1) & mask
+        hn = (hn << 1) & mask
+        vp = (hn | ~(xv | hp)) & mask
+        vn = hp & xv
+    return score
+
+
+def _last_levenshtein_row(
+        s: Sequence[Hashable],
+        t: Sequence[Hashable],
+        substitution_cost: int = 1
+) -> Sequence[int]:
+    """Returns the last row of the Levenshtein matrix from :obj:`s` to :obj:`t`.
+
+    Each cell only depends upon the previous row and the current row's previous cell, so only two rows of the matrix,
+    each of length ``len(t) + 1``, are kept in memory at once. Long rows are computed with vectorized numpy operations:
+    the removal and match costs of a row depend only upon the previous row, and the chain of insertions along the row
+    is then resolved with a running minimum.
+
+    Insertions and removals cost one, and matching two unequal items costs :obj:`substitution_cost`. A substitution
+    cost of two therefore calculates the insertion/removal (or "indel") distance.
+
+    """
+    if len(t) >= VECTORIZED_ROW_LENGTH:
+        return _vectorized_last_levenshtein_row(s, t, substitution_cost)
+    prev_row = array('i', range(len(t) + 1))
+    row = array('i', prev_row)
+    for i, sc in enumerate(s, start=1):
+        row[0] = i
+        for j, tc in enumerate(t, start=1):
+            if sc == tc:
+                cost = 0
+            else:
+                cost = substitution_cost
+            row[j] = min(prev_row[j] + 1,
+                         row[j - 1] + 1,
+                         prev_row[j - 1] + cost)
+        prev_row, row = row, prev_row
+    return prev_row
+
+
+VECTORIZED_ROW_LENGTH: int = 32
+"""Rows of the Levenshtein matrix at least this long are calculated with numpy rather than pure Python."""
+
+
+def _symbol_codes(s: Sequence[Hashable], t: Sequence[Hashable]) -> Tuple[np.ndarray, np.ndarray]:
+    """Maps the items of both sequences to integers such that equal items have equal codes."""
+    symbols: Dict[Hashable, int] = {}
+    s_codes = np.fromiter((symbols.setdefault(c, len(symbols)) for c in s), dtype=np.int64, count=len(s))
+    t_codes = np.fromiter((symbols.setdefault(c, len(symbols)) for c in t), dtype=np.int64, count=len(t))
+    return s_codes, t_codes
+
+
+MAX_MISMATCH_MATRIX_SIZE: int = 2**24
+"""The maximum number of cells in the matrix of mismatches precomputed by the vectorized Levenshtein recurrence."""
+
+
+def _vectorized_last_levenshtein_row(
+        s: Sequence[Hashable],
+        t: Sequence[Hashable],
+        substitution_cost: int = 1
+) -> np.ndarray:
+    s_codes, t_codes = _symbol_codes(s, t)
+    offsets = np.arange(len(t) + 1, dtype=np.int64)
+    prev_row = offsets.copy()
+    row = np.empty_like(prev_row)
+    # The items of `s` are assigned the codes 0 through num_symbols - 1, so `mismatches[code]` is the boolean vector of
+    # which items in `t` differ from the item of `s` with that code. Computing them all in a single broadcast means that
+    # each distinct item is only compared against `t` once, rather than once per occurrence:
+    num_symbols = int(s_codes.max()) + 1 if len(s_codes) else 0
+    if num_symbols * len(t_codes) <= MAX_MISMATCH_MATRIX_SIZE:
+        mismatches: Optional[np.ndarray] = np.arange(num_symbols, dtype=np.int64)[:, np.newaxis] != t_codes
+    else:
+        mismatches = None
+    for i, sc in enumerate(s_codes.tolist(), start=1):
+        row[0] = i
+        if mismatches is None:
+            mismatch = t_codes != sc
+        else:
+            mismatch = mismatches[sc]
+        if substitution_cost != 1:
+            # Only scale one row at a time, so that the precomputed matrix stays boolean (one byte per cell)
+            mismatch = mismatch * substitution_cost
+        np.minimum(prev_row[1:] + 1, prev_row[:-1] + mismatch, out=row[1:])
+        # row[j] = min(row[j], row[j - 1] + 1) for all j, which is min over k <= j of (row[k] + j - k):
+        row -= offsets
+        np.minimum.accumulate(row, out=row)
+        row += offsets
+        prev_row, row = row, prev_row
+    return prev_row
+
+
+def _full_matrix_alignment(
+        s: Sequence[Hashable],
+        t: Sequence[Hashable],
+        substitution_cost: int = 1
+) -> Iterator[Tuple[Optional[int], Optional[int]]]:
     rows = len(s) + 1
     cols = len(t) + 1
-    dist: List[List[int]] = [[0] * cols for _ in range(rows)]
+    # The matrix is stored flattened in row-major order, so cell (row, col) is at index `row * cols + col`:
+    dist = array('i', bytes(rows * cols * array('i').itemsize))
+    for col in range(cols):
+        dist[col] = col
+    for row in range(1, rows):
+        offset = row * cols
+        dist[offset] = row
+        sc = s[row - 1]
+        for col in range(1, cols):
+            if sc == t[col - 1]:
+                cost = 0
+            else:
+                cost = substitution_cost
+            dist[offset + col] = min(dist[offset - cols + col] + 1,
+                                     dist[offset + col - 1] + 1,
+                                     dist[offset - cols + col - 1] + cost)
+    reversed_alignment: List[Tuple[Optional[int], Optional[int]]] = []
+    row, col = rows - 1, cols - 1
+    while row > 0 or col > 0:
+        index = row * cols + col
+        if row > 0 and col > 0 and dist[index] == dist[index - cols - 1] + \
+                int(s[row - 1] != t[col - 1]) * substitution_cost:
+            row, col = row - 1, col - 1
+            reversed_alignment.append((row, col))
+        elif row > 0 and dist[index] == dist[index - cols] + 1:
+            row -= 1
+            reversed_alignment.append((row, None))
+        else:
+            col -= 1
+            reversed_alignment.append((None, col))
+    return reversed(reversed_alignment)
+
+
+def levenshtein_alignment(
+        s: Sequence[Hashable],
+        t: Sequence[Hashable],
+        max_matrix_size: int = 4096,
+        substitution_cost: int = 1
+) -> Iterator[Tuple[Optional[int], Optional[int]]]:
+    """Calculates an optimal alignment between two sequences using `Hirschberg's algorithm`_.
 
-    for i in range(1, rows):
-        dist[i][0] = i
+    Hirschberg's algorithm splits :obj:`s` in half, uses two linear space passes of the Levenshtein recurrence (one
+    forward and one on the reversed sequences) to find where the optimal alignment crosses that split in :obj:`t`, and
+    then recurses on the two halves. This finds an optimal alignment using memory linear in the lengths of the
+    sequences, rather than the quadratic memory required to reconstruct it from the full Levenshtein matrix.
+
+    .. _Hirschberg's algorithm:
+        https://en.wikipedia.org/wiki/Hirschberg%27s_algorithm
+
+    Args:
+        s: the sequence from which to match
+        t: the sequence to which to match
+        max_matrix_size: sub-problems whose full Levenshtein matrix has at most this many cells are solved directly,
+            since that is faster than further recursion
+        substitution_cost: the cost of matching two unequal items; insertions and removals always cost one
+
+    Returns:
+        Iterator[Tuple[Optional[int], Optional[int]]]: The alignment, in order, as pairs of indexes into :obj:`s` and
+        :obj:`t`. A pair :obj:`(i, j)` matches :obj:`s[i]` to :obj:`t[j]`, :obj:`(i, None)` removes :obj:`s[i]`, and
+        :obj:`(None, j)` inserts :obj:`t[j]`.
+
+    """
+    # Sub-problems are pushed in reverse order so that the alignment is yielded in order
+    stack: List[Tuple[int, int, int, int]] = [(0, len(s), 0, len(t))]
+    while stack:
+        s_start, s_end, t_start, t_end = stack.pop()
+        if s_start == s_end:
+            for j in range(t_start, t_end):
+                yield None, j
+        elif t_start == t_end:
+            for i in range(s_start, s_end):
+                yield i, None
+        elif s_end - s_start == 1 or (s_end - s_start) * (t_end - t_start) <= max_matrix_size:
+            for i, j in _full_matrix_alignment(s[s_start:s_end], t[t_start:t_end], substitution_cost):
+                yield (
+                    None if i is None else i + s_start,
+                    None if j is None else j + t_start
+                )
+        else:
+            s_mid = (s_start + s_end) // 2
+            forward = _last_levenshtein_row(s[s_start:s_mid], t[t_start:t_end], substitution_cost)
+            backward = _last_levenshtein_row(s[s_mid:s_end][::-1], t[t_start:t_end][::-1], substitution_cost)
+            t_split = int(np.argmin(np.add(forward, backward[::-1])))
+            stack.append((s_mid, s_end, t_start + t_split, t_end))
+            stack.append((s_start, s_mid, t_start, t_start + t_split))
 
-    for i in range(1, cols):
-        dist[0][i] = i
 
-    col = row = 0
+MAX_EXACT_ALIGNMENT_SIZE: int = 2**22
+"""The maximum number of cells in the Levenshtein matrix for which :class:`LinearSpaceEditDistance` reconstructs
+exactly the same edits as :class:`EditDistance`. Longer sequences are aligned in linear space, which has the same cost
+but might choose a different one of several equally cheap alignments."""
+
+
+def _edit_distance_alignment(
+        from_seq: Sequence[Hashable],
+        to_seq: Sequence[Hashable]
+) -> List[Tuple[Optional[int], Optional[int]]]:
+    """Aligns two sequences of unit-sized items exactly as :class:`EditDistance` would.
+
+    Only equal items are matched; all others are removed or inserted at a cost of one. Like :class:`EditDistance`, any
+    shared prefix and suffix are matched outright, and ties between equally cheap alignments of the remainder are broken
+    the same way as :meth:`EditDistance._best_match`, by comparing the cost and then the length of the path to each
+    neighboring cell. Only two rows of costs and path lengths are kept, along with one byte per cell for the
+    backpointers.
+
+    Returns:
+        List[Tuple[Optional[int], Optional[int]]]: The alignment, in the same format as :func:`levenshtein_alignment`.
+
+    """
+    prefix = 0
+    for from_item, to_item in zip(from_seq, to_seq):
+        if from_item != to_item:
+            break
+        prefix += 1
+    suffix = 0
+    for from_item, to_item in zip(reversed(from_seq[prefix:]), reversed(to_seq[prefix:])):
+        if from_item != to_item:
+            break
+        suffix += 1
+    from_seq = from_seq[prefix:len(from_seq) - suffix]
+    to_seq = to_seq[prefix:len(to_seq) - suffix]
+    cols = len(from_seq) + 1
+    rows = len(to_seq) + 1
+    backpointers = bytearray(rows * cols)
     for col in range(1, cols):
-        for row in range(1, rows):
-            if s[row - 1] == t[col - 1]:
-                cost = 0
+        backpointers[col] = EditDistance.LEFT
+    prev_costs = array('i', range(cols))
+    prev_lengths = array('i', prev_costs)
+    costs = array('i', prev_costs)
+    lengths = array('i', prev_costs)
+    for row in range(1, rows):
+        offset = row * cols
+        backpointers[offset] = EditDistance.UP
+        costs[0] = row
+        lengths[0] = row
+        item = to_seq[row - 1]
+        for col in range(1, cols):
+            diagonal = (prev_costs[col - 1], prev_lengths[col - 1])
+            left = (costs[col - 1], lengths[col - 1])
+            up = (prev_costs[col], prev_lengths[col])
+            if from_seq[col - 1] == item and diagonal <= left and diagonal <= up:
+                backpointers[offset + col] = EditDistance.DIAGONAL
+                costs[col] = diagonal[0]
+                lengths[col] = diagonal[1] + 1
+            elif up <= diagonal:
+                backpointers[offset + col] = EditDistance.UP
+                costs[col] = up[0] + 1
+                lengths[col] = up[1] + 1
             else:
-                cost = 1
-            dist[row][col] = min(dist[row - 1][col] + 1,
-                                 dist[row][col - 1] + 1,
-                                 dist[row - 1][col - 1] + cost)
-
-    return dist[row][col]
+                backpointers[offset + col] = EditDistance.LEFT
+                costs[col] = left[0] + 1
+                lengths[col] = left[1] + 1
+        prev_costs, costs = costs, prev_costs
+        prev_lengths, lengths = lengths, prev_lengths
+    reversed_alignment: List[Tuple[Optional[int], Optional[int]]] = [
+        (prefix + cols - 1 + i, prefix + rows - 1 + i) for i in reversed(range(suffix))
+    ]
+    row, col = rows - 1, cols - 1
+    while row > 0 or col > 0:
+        backpointer = backpointers[row * cols + col]
+        if backpointer == EditDistance.DIAGONAL:
+            row, col = row - 1, col - 1
+            reversed_alignment.append((prefix + col, prefix + row))
+        elif backpointer == EditDistance.UP:
+            row -= 1
+            reversed_alignment.append((None, prefix + row))
+        else:
+            col -= 1
+            reversed_alignment.append((prefix + col, None))
+    reversed_alignment.extend((i, i) for i in reversed(range(prefix)))
+    reversed_alignment.reverse()
+    return reversed_alignment
 
 
 class EditDistance(SequenceEdit):
@@ -82,7 +401,17 @@ class EditDistance(SequenceEdit):
     by the minimum cost of an edit in the last-expanded diagonal. This results in a monotonically decreasing upper
     bound.
 
+    As each cell's cost is finalized, a backpointer to its predecessor on the cheapest path is recorded, so the optimal
+    sequence of edits is reconstructed in time linear in the lengths of the sequences.
+
     """
+    DIAGONAL: int = 1
+    """Backpointer to the cell up and to the left, matching the from and to nodes."""
+    UP: int = 2
+    """Backpointer to the cell above, inserting a node."""
+    LEFT: int = 3
+    """Backpointer to the cell to the left, removing a node."""
+
     def __init__(
             self,
             from_node: TreeNode,
@@ -147,6 +476,9 @@ class EditDistance(SequenceEdit):
         ]
         self.path_costs = np.full((len(self.to_seq) + 1, len(self.from_seq) + 1), 0, dtype=np.uint16)
         self.costs = np.full((len(self.to_seq) + 1, len(self.from_seq) + 1), 0, dtype=np.uint64)
+        # Backpointers for each cell that has been resolved by `self._best_match`, so the optimal edit sequence can be
+        # reconstructed without redoing the comparisons: 0 = unresolved, DIAGONAL, UP, or LEFT
+        self.backpointers = np.full((len(self.to_seq) + 1, len(self.from_seq) + 1), 0, dtype=np.uint8)
         self._fringe_row: int = -1
         self._fringe_col: int = 0
         super().__init__(
@@ -164,12 +496,12 @@ class EditDistance(SequenceEdit):
             edit = None
         elif row == 0:
             edit = Remove(to_remove=self.from_seq[col - 1], remove_from=self.from_node, penalty=self.penalty)
-            self.costs[0][col] = self.costs[0][col-1] + edit.bounds().upper_bound
-            self.path_costs[0][col] = self.path_costs[0][col - 1] + 1
+            self.costs[0, col] = self.costs[0, col-1] + edit.bounds().upper_bound
+            self.path_costs[0, col] = self.path_costs[0, col - 1] + 1
         elif col == 0:
             edit = Insert(to_insert=self.to_seq[row - 1], insert_into=self.from_node, penalty=self.penalty)
-            self.costs[row][0] = self.costs[row - 1][0] + edit.bounds().upper_bound
-            self.path_costs[row][0] = self.path_costs[row - 1][0] + 1
+            self.costs[row, 0] = self.costs[row - 1, 0] + edit.bounds().upper_bound
+            self.path_costs[row, 0] = self.path_costs[row - 1, 0] + 1
         else:
             edit = self.from_seq[col-1].edits(self.to_seq[row-1])
         self.edit_matrix[row][col] = edit
@@ -210,10 +542,16 @@ class EditDistance(SequenceEdit):
         elif col == 0:
             assert row > 0
             return row - 1, col, self.edit_matrix[row][0]
+        elif self.backpointers[row, col] == EditDistance.DIAGONAL:
+            return row - 1, col - 1, self.edit_matrix[row][col]
+        elif self.backpointers[row, col] == EditDistance.UP:
+            return row - 1, col, self.edit_matrix[row][0]
+        elif self.backpointers[row, col] == EditDistance.LEFT:
+            return row, col - 1, self.edit_matrix[0][col]
         else:
-            dcost = (self.costs[row - 1][col - 1], self.path_costs[row - 1][col - 1])
-            lcost = (self.costs[row][col - 1], self.path_costs[row][col - 1])
-            ucost = (self.costs[row - 1][col], self.path_costs[row - 1][col])
+            dcost = (self.costs[row - 1, col - 1], self.path_costs[row - 1, col - 1])
+            lcost = (self.costs[row, col - 1], self.path_costs[row, col - 1])
+            ucost = (self.costs[row - 1, col], self.path_costs[row - 1, col])
             diag_is_best = dcost <= lcost and dcost <= ucost
             if diag_is_best:
                 make_distinct(self.edit_matrix[row][col], self.edit_matrix[row][0], self.edit_matrix[0][col])
@@ -221,12 +559,15 @@ class EditDistance(SequenceEdit):
                     self.edit_matrix[row][col].bounds() < self.edit_matrix[row][0].bounds() and \
                     self.edit_matrix[row][col].bounds() < self.edit_matrix[0][col].bounds():
                 brow, bcol, edit = row - 1, col - 1, self.edit_matrix[row][col]
+                self.backpointers[row, col] = EditDistance.DIAGONAL
             elif ucost <= dcost:
                 brow, bcol, edit = row - 1, col, self.edit_matrix[row][0]
+                self.backpointers[row, col] = EditDistance.UP
             else:
                 brow, bcol, edit = row, col - 1, self.edit_matrix[0][col]
-            self.path_costs[row][col] = self.path_costs[brow][bcol] + 1
-            self.costs[row][col] = self.costs[brow][bcol] + edit.bounds().upper_bound
+                self.backpointers[row, col] = EditDistance.LEFT
+            self.path_costs[row, col] = self.path_costs[brow, bcol] + 1
+            self.costs[row, col] = self.costs[brow, bcol] + edit.bounds().upper_bound
             return brow, bcol, edit
 
     def tighten_bounds(self) -> bool:
@@ -250,7 +591,8 @@ class EditDistance(SequenceEdit):
             # Tighten the entire fringe diagonal until every node in it is definitive
             if not self._next_fringe():
                 assert self.is_complete()
-                if not self.edit_matrix[-1][-1].bounds().definitive():
+                # Calculating the bounds of a complete matrix can itself finalize the edits and clean up the matrix
+                if self.edit_matrix is not None and not self.edit_matrix[-1][-1].bounds().definitive():
                     ret = self.tighten_bounds()
                 else:
                     ret = False
@@ -314,14 +656,14 @@ class EditDistance(SequenceEdit):
             if self.__edits is None:
                 # We need to construct the edits to finalize the cost matrix:
                 _ = self.edits()
-            cost = int(self.costs[len(self.to_seq)][len(self.from_seq)])
+            cost = int(self.costs[len(self.to_seq), len(self.from_seq)])
             return Range(cost, cost)
         else:
             if self._fringe_row <= 0:
                 return base_bounds
             return Range(
                 max(base_bounds.lower_bound, min(
-                    int(self.costs[row][col]) for row, col in self._fringe_diagonal()
+                    int(self.costs[row, col]) for row, col in self._fringe_diagonal()
                 )),
                 base_bounds.upper_bound
             )
@@ -334,13 +676,16 @@ class EditDistance(SequenceEdit):
             # we don't need the matrix anymore, so save memory by wiping it out
             self.edit_matrix = None
             self.path_costs = None
+            self.backpointers = None
             # We only need the last cell in the costs matrix, so switch to using a dict to clean up the others:
-            self.costs = {len(self.to_seq): {len(self.from_seq): self.costs[len(self.to_seq)][len(self.from_seq)]}}
+            self.costs = {
+                (len(self.to_seq), len(self.from_seq)): self.costs[len(self.to_seq), len(self.from_seq)]
+            }
 
     def edits(self) -> Iterator[Edit]:
         if self.__edits is None:
             reversed_suffix: List[Edit] = [
-                Match(from_node, to_node, 0) for from_node, to_node in self.reversed_shared_suffix
+                Match.zero_cost(from_node, to_node) for from_node, to_node in self.reversed_shared_suffix
             ]
             if self.to_seq or self.from_seq:
                 while not self.is_complete() and self.tighten_bounds():
@@ -359,9 +704,109 @@ class EditDistance(SequenceEdit):
                 self.__edits = reversed_suffix
             self._cleanup()
         return itertools.chain(
-            (Match(from_node, to_node, 0) for from_node, to_node in self.shared_prefix),
+            (Match.zero_cost(from_node, to_node) for from_node, to_node in self.shared_prefix),
             reversed(self.__edits)
         )
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}<from_seq={list(map(str, self.from_seq))!r}, to_seq={list(map(str, self.to_seq))!r}, insert_remove_penalty={self.penalty}>"
+
+
+class LinearSpaceEditDistance(SequenceEdit):
+    """An edit distance between two sequences of unit-sized leaves, like the characters of a string.
+
+    Unlike :class:`EditDistance`, this edit never materializes a matrix of edits, so it can be used on very long
+    sequences. Its cost is calculated in one linear space pass of the Levenshtein recurrence, and the edits themselves
+    are only reconstructed once they are requested: with one byte of backpointer per cell if there are at most
+    :data:`MAX_EXACT_ALIGNMENT_SIZE` cells, so that the edits are exactly those :class:`EditDistance` would choose, and
+    otherwise in linear space using :func:`levenshtein_alignment`.
+
+    Every node in the sequences is assumed to have a :attr:`graphtage.TreeNode.total_size` of one. The costs are the
+    same as those of an :class:`EditDistance` with an :obj:`insert_remove_penalty` of zero: removing or inserting a node
+    costs one, and two unequal nodes are never matched, but are rather removed and inserted at a cost of two. The
+    insertions and removals between each pair of matched nodes are also ordered the same way as :class:`EditDistance`
+    orders them, inserts first.
+
+    """
+    def __init__(
+            self,
+            from_node: TreeNode,
+            to_node: TreeNode,
+            from_seq: Sequence[TreeNode],
+            to_seq: Sequence[TreeNode]
+    ):
+        """Initializes the edit distance edit.
+
+        Args:
+            from_node: The node that will be transformed.
+            to_node: The node into which :obj:`from_node` will be transformed.
+            from_seq: A sequence of nodes that comprise :obj:`from_node`.
+            to_seq: A sequence of nodes that comprise :obj:`to_node`.
+
+        """
+        self.from_seq: Sequence[TreeNode] = from_seq
+        self.to_seq: Sequence[TreeNode] = to_seq
+        self._cost: Optional[int] = None
+        self.__edits: Optional[List[Edit]] = None
+        super().__init__(
+            from_node=from_node,
+            to_node=to_node,
+            constant_cost=abs(len(from_seq) - len(to_seq)),
+            cost_upper_bound=len(from_seq) + len(to_seq)
+        )
+
+    def _symbols(self) -> Tuple[List[int], List[int]]:
+        # Map each distinct node to an integer so that the nodes are only hashed and compared once
+        symbols: Dict[TreeNode, int] = {}
+        from_symbols = [symbols.setdefault(node, len(symbols)) for node in self.from_seq]
+        to_symbols = [symbols.setdefault(node, len(symbols)) for node in self.to_seq]
+        return from_symbols, to_symbols
+
+    def tighten_bounds(self) -> bool:
+        if self._cost is not None:
+            return False
+        was_definitive = super().bounds().definitive()
+        from_symbols, to_symbols = self._symbols()
+        if len(from_symbols) < len(to_symbols):
+            # The distance is symmetric, so iterate over the longer sequence to keep the rows as short as possible
+            from_symbols, to_symbols = to_symbols, from_symbols
+        self._cost = int(_last_levenshtein_row(from_symbols, to_symbols, substitution_cost=2)[-1])
+        return not was_definitive
+
+    def bounds(self) -> Range:
+        if self._cost is None:
+            return super().bounds()
+        return Range(self._cost, self._cost)
+
+    def edits(self) -> Iterator[Edit]:
+        if self.__edits is None:
+            self.__edits = []
+            from_symbols, to_symbols = self._symbols()
+            if len(from_symbols) * len(to_symbols) <= MAX_EXACT_ALIGNMENT_SIZE:
+                alignment: Iterable[Tuple[Optional[int], Optional[int]]] = _edit_distance_alignment(
+                    from_symbols, to_symbols
+                )
+            else:
+                alignment = levenshtein_alignment(from_symbols, to_symbols, substitution_cost=2)
+            # The insertions and removals since the last match:
+            inserts: List[Edit] = []
+            removes: List[Edit] = []
+            for i, j in alignment:
+                if i is not None and j is not None and from_symbols[i] == to_symbols[j]:
+                    self.__edits.extend(inserts)
+                    self.__edits.extend(removes)
+                    inserts, removes = [], []
+                    self.__edits.append(Match.zero_cost(self.from_seq[i], self.to_seq[j]))
+                    continue
+                # Unequal nodes are never matched; they are removed and inserted instead
+                if i is not None:
+                    removes.append(Remove(to_remove=self.from_seq[i], remove_from=self.from_node, penalty=0))
+                if j is not None:
+                    inserts.append(Insert(to_insert=self.to_seq[j], insert_into=self.from_node, penalty=0))
+            self.__edits.extend(inserts)
+            self.__edits.extend(removes)
+            self._cost = sum(edit.bounds().upper_bound for edit in self.__edits)
+        return iter(self.__edits)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}<from_seq={list(map(str, self.from_seq))!r}, to_seq={list(map(str, self.to_seq))!r}>"
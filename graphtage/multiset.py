@@ -45,7 +45,7 @@ class MultiSetEdit(SequenceEdit):
         self.to_remove = from_set - to_set
         """The set of nodes in :obj:`from_set` that do not exist in :obj:`to_set`."""
         to_match = from_set & to_set
-        self._edits: List[Edit] = [Match(n, n, 0) for n in to_match.elements()]
+        self._edits: List[Edit] = [Match.zero_cost(n, n) for n in to_match.elements()]
         self._matcher = WeightedBipartiteMatcher(
             from_nodes=self.to_remove.elements(),
             to_nodes=self.to_insert.elements(),
@@ -15,7 +15,7 @@ smallest integer (*i.e.*, with the fewest possible tightenings).
 
 from typing import Generic, Iterator, Optional, TypeVar
 
-from .bounds import Bounded, NEGATIVE_INFINITY, POSITIVE_INFINITY, Range
+from .bounds import Bounded, NEGATIVE_INFINITY, POSITIVE_INFINITY, Range, RangeValue
 from .fibonacci import FibonacciHeap, HeapNode
 
 B = TypeVar('B', bound=Bounded)
@@ -52,6 +52,11 @@ class IterativeTighteningSearch(Bounded, Generic[B]):
         # Fully tightened (`definitive`) ranges, sorted by increasing bound
         self._tightened: FibonacciHeap[B, Range] = FibonacciHeap(key=get_range)
 
+        # The minimum lower bound of the keys in both heaps, or `None` if either heap has changed since it was last
+        # calculated. Keys only change when the heaps are modified, so this saves `self.bounds()` from having to
+        # iterate over every node in the heaps each time it is called.
+        self._lower_bound: Optional[RangeValue] = None
+
         if initial_bounds is None:
             self.initial_bounds = Range(NEGATIVE_INFINITY, POSITIVE_INFINITY)
         else:
@@ -112,6 +117,7 @@ class IterativeTighteningSearch(Bounded, Generic[B]):
             heap = self._tightened
         else:
             heap = self._untightened
+        self._lower_bound = None
         return heap.pop()
 
     def search(self) -> B:
@@ -128,19 +134,22 @@ class IterativeTighteningSearch(Bounded, Generic[B]):
             pass
         return self.best_match
 
-    def _nodes(self) -> Iterator[HeapNode[B, Range]]:
-        yield from self._untightened.nodes()
-        yield from self._tightened.nodes()
+    def _nodes_lower_bound(self) -> RangeValue:
+        if self._lower_bound is None:
+            lb = POSITIVE_INFINITY
+            for heap in (self._untightened, self._tightened):
+                for node in heap.nodes():
+                    if not node.deleted and node.key.lower_bound < lb:
+                        lb = node.key.lower_bound
+            self._lower_bound = lb
+        return self._lower_bound
 
     def bounds(self) -> Range:
         if self.best_match is None:
             return self.initial_bounds
         else:
             if self._unprocessed is None and (self._untightened or self._tightened):
-                lb = POSITIVE_INFINITY
-                for node in self._nodes():
-                    if not node.deleted:
-                        lb = min(node.key.lower_bound, lb)
+                lb = self._nodes_lower_bound()
                 if lb == POSITIVE_INFINITY or lb < self.initial_bounds.lower_bound:
                     lb = self.initial_bounds.lower_bound
             else:
@@ -148,6 +157,7 @@ class IterativeTighteningSearch(Bounded, Generic[B]):
             return Range(min(lb, self.best_match.bounds().upper_bound), self.best_match.bounds().upper_bound)
 
     def _delete_node(self, node: HeapNode[B, Range]):
+        self._lower_bound = None
         self._untightened.decrease_key(node, Range(NEGATIVE_INFINITY, NEGATIVE_INFINITY))
         self._untightened.pop()
         node.deleted = True
@@ -168,6 +178,7 @@ class IterativeTighteningSearch(Bounded, Generic[B]):
         elif bounds.lower_bound > node.key.lower_bound:
             # The lower bound increased, so we need to remove and re-add the node
             # because the Fibonacci heap only permits making keys smaller
+            self._lower_bound = None
             self._untightened.decrease_key(node, Range(NEGATIVE_INFINITY, NEGATIVE_INFINITY))
             self._untightened.pop()
             self._untightened.push(node.item)
@@ -183,6 +194,7 @@ class IterativeTighteningSearch(Bounded, Generic[B]):
         starting_bounds = self.bounds()
         while True:
             if self._unprocessed is not None:
+                self._lower_bound = None
                 try:
                     next_best: B = next(self._unprocessed)
                     if self.initial_bounds.lower_bound > NEGATIVE_INFINITY and \
@@ -196,13 +208,16 @@ class IterativeTighteningSearch(Bounded, Generic[B]):
                         else:
                             self._untightened.push(next_best)
                         return True
-                    if starting_bounds.dominates(next_best.bounds()) or \
-                            (self.best_match is not None
-                             and self.best_match.bounds().dominates(next_best.bounds())) or \
-                            self.initial_bounds.dominates(next_best.bounds()):
+                    # `self.best_match` is always `None` until every possibility has been processed, so find the best
+                    # upper bound of the possibilities added so far directly from the heaps:
+                    best_upper_bound = POSITIVE_INFINITY
+                    for heap in (self._untightened, self._tightened):
+                        if heap:
+                            best_upper_bound = min(best_upper_bound, heap.peek().bounds().upper_bound)
+                    if best_upper_bound < next_best.bounds().lower_bound:
                         # No need to add this new edit if it is strictly worse than the current best!
                         pass
-                    if next_best.bounds().definitive():
+                    elif next_best.bounds().definitive():
                         self._tightened.push(next_best)
                     else:
                         self._untightened.push(next_best)
@@ -214,10 +229,12 @@ class IterativeTighteningSearch(Bounded, Generic[B]):
                     if len(self._untightened) == 1:
                         untightened = self._untightened.peek()
                         if untightened.tighten_bounds() and untightened.bounds().definitive():
+                            self._lower_bound = None
                             self._untightened.clear()
                             self._tightened.push(untightened)
                     if self.goal_test():
                         best = self.best_match
+                        self._lower_bound = None
                         self._untightened.clear()
                         self._tightened.clear()
                         ret = best.tighten_bounds()
@@ -227,7 +244,9 @@ class IterativeTighteningSearch(Bounded, Generic[B]):
                             self._untightened.push(best)
                         assert self.best_match == best
                         return ret
-                for node in list(self._untightened.min_node):
+                # The heap is only modified by `self._update_bounds`, after which we immediately stop iterating, so
+                # there is no need to copy its nodes into a list first:
+                for node in self._untightened.min_node:
                     if node.deleted:
                         continue
                     tightened = node.item.tighten_bounds()
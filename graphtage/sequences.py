@@ -78,14 +78,19 @@ class FixedLengthSequenceEdit(SequenceEdit):
             self.to_remove = ()
             self.to_insert = ()
 
+        self._remove_insert_edits: List[Edit] = [
+            Remove(to_remove=r, remove_from=from_node) for r in self.to_remove
+        ] + [
+            Insert(to_insert=i, insert_into=from_node) for i in self.to_insert
+        ]
+        # The removals and insertions have constant costs, so total them once rather than on every call to `bounds()`
+        self._remove_insert_cost: int = sum(edit.bounds().upper_bound for edit in self._remove_insert_edits)
+
         super().__init__(from_node=from_node, to_node=to_node)
 
     def edits(self) -> Iterator[Edit]:
         yield from self._sub_edits
-        for r in self.to_remove:
-            yield Remove(to_remove=r, remove_from=self.from_node)
-        for i in self.to_insert:
-            yield Insert(to_insert=i, insert_into=self.from_node)
+        yield from self._remove_insert_edits
 
     def is_complete(self) -> bool:
         return all(edit.is_complete() for edit in self._sub_edits)
@@ -102,9 +107,9 @@ class FixedLengthSequenceEdit(SequenceEdit):
         return False
 
     def bounds(self) -> Range:
-        lb = 0
-        ub = 0
-        for edit in self.edits():
+        lb = self._remove_insert_cost
+        ub = self._remove_insert_cost
+        for edit in self._sub_edits:
             b = edit.bounds()
             lb += b.lower_bound
             ub += b.upper_bound
@@ -314,7 +319,7 @@ class SequenceFormatter(GraphtageFormatter):
             if isinstance(node, EditedTreeNode) and isinstance(node.edit, SequenceEdit):
                 edits: Iterable[Edit] = node.edit.edits()
             else:
-                edits: Iterable[Edit] = [Match(child, child, 0) for child in node]
+                edits: Iterable[Edit] = [Match.zero_cost(child, child) for child in node]
             for i, edit in enumerate(edits):
                 if isinstance(edit, Remove):
                     to_remove += 1
@@ -1,4 +1,3 @@
-import itertools
 import logging
 import sys
 from abc import abstractmethod, ABC, ABCMeta
@@ -220,13 +219,16 @@ def explode_edits(edit: Edit) -> Iterator[Edit]:
 
     If an edit implements the :class:`CompoundEdit` protocol, its sub-edits are recursively included in the output.
 
-    This implementation is equivalent to::
+    This is equivalent to::
 
         if isinstance(edit, CompoundEdit):
             return itertools.chain(*map(explode_edits, edit.edits()))
         else:
             return iter((edit,))
 
+    except that the traversal uses an explicit stack rather than recursion, so it is not limited by Python's recursion
+    limit on very deeply nested edits, and the sub-edits of each compound edit are only expanded as they are reached.
+
     Args:
         edit: The edit that is to be exploded
 
@@ -234,10 +236,17 @@ def explode_edits(edit: Edit) -> Iterator[Edit]:
         Iterator[Edit]: An iterator over the edits.
 
     """
-    if isinstance(edit, CompoundEdit):
-        return itertools.chain(*map(explode_edits, edit.edits()))
-    else:
-        return iter((edit,))
+    stack: List[Iterator[Edit]] = [iter((edit,))]
+    while stack:
+        try:
+            sub_edit = next(stack[-1])
+        except StopIteration:
+            stack.pop()
+            continue
+        if isinstance(sub_edit, CompoundEdit):
+            stack.append(iter(sub_edit.edits()))
+        else:
+            yield sub_edit
 
 
 E = TypeVar('E', bound=Union['EditedTreeNode', 'TreeNode'])
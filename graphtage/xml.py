@@ -208,7 +208,7 @@ class XMLElement(ContainerNode):
 
     def edits(self, node) -> Edit:
         if self == node:
-            return Match(self, node, 0)
+            return Match.zero_cost(self, node)
         else:
             return XMLElementEdit(self, node)
 
@@ -34,6 +34,7 @@ setup(
         ]
     },
     extras_require={
+        "fast": ["rapidfuzz>=2.0.0"],
         "dev": ["flake8", "Sphinx", "pytest", "sphinx_rtd_theme==0.4.3"]
     },
     classifiers=[
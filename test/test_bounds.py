@@ -4,7 +4,7 @@ from unittest import TestCase
 
 from tqdm import trange
 
-from graphtage.bounds import Bounded, make_distinct, Range, sort
+from graphtage.bounds import Bounded, FrozenRange, make_distinct, Range, sort
 
 
 class RandomDecreasingRange(Bounded):
@@ -70,6 +70,16 @@ class TestBounds(TestCase):
             for expected, actual in zip(sorted_ranges, sort(ranges)):
                 self.assertEqual(expected.final_value, actual.final_value)
 
+    def test_frozen_range(self):
+        r = FrozenRange(1, 2)
+        self.assertEqual(Range(1, 2), r)
+        with self.assertRaises(AttributeError):
+            r.lower_bound = 0
+        with self.assertRaises(AttributeError):
+            r.upper_bound += 1
+        self.assertEqual(Range(1, 2), r)
+        self.assertEqual(Range(2, 4), r + r)
+
     def test_make_distinct(self):
         speedups = 0
         tests = 0
@@ -52,6 +52,10 @@ class TestFibonacciHeap(TestCase):
     def test_node_traversal(self):
         heap = self.random_heap()
         self.assertEqual(sum(1 for _ in heap.nodes()), len(heap))
+        # Popping consolidates the heap into trees, so this also exercises traversal of the nodes' children:
+        for _ in range(len(self.random_list) // 2):
+            heap.pop()
+        self.assertEqual(self.sorted_list[len(self.random_list) // 2:], sorted(node.item for node in heap.nodes()))
 
     def test_manual_node_deletion(self):
         heap = self.random_heap()
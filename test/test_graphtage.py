@@ -1,8 +1,11 @@
+import random
 from io import StringIO
 from unittest import TestCase
+from unittest.mock import patch
 
 import graphtage
 import graphtage.json
+import graphtage.levenshtein
 import graphtage.multiset
 import graphtage.tree
 
@@ -103,3 +106,31 @@ class TestGraphtage(TestCase):
         self.assertEqual(1, len(diff.edit_list))
         self.assertIsInstance(diff.edit_list[0], graphtage.Match)
         self.assertEqual(0, diff.edit_list[0].bounds().upper_bound)
+
+    def test_nan_list_edit(self):
+        # Both lists contain the very same NaN object, but NaN is not equal to itself, so neither are the lists
+        nan = float('nan')
+        list_from = graphtage.json.build_tree([nan, 1])
+        list_to = graphtage.json.build_tree([nan, 1])
+        self.assertNotEqual(list_from, list_to)
+        self.assertIsInstance(list_from.edits(list_to), graphtage.EditDistance)
+
+    def test_long_multi_line_string_dict_diff(self):
+        random.seed(0)
+
+        def long_string() -> str:
+            return '\n'.join(''.join(random.choices('abcd ', k=80)) for _ in range(2))
+
+        dict_from = graphtage.json.build_tree({
+            "x": [[long_string(), long_string()], [long_string()]],
+            "y": [[long_string()]]
+        })
+        dict_to = graphtage.json.build_tree({
+            "x": [[long_string(), long_string(), long_string()], [long_string(), long_string()]],
+            "y": [[long_string(), long_string()], []]
+        })
+        # Without status messages, nested edit distances are tightened back to back without querying their bounds
+        with patch.object(graphtage.levenshtein.DEFAULT_PRINTER, 'quiet', True):
+            diff = dict_from.diff(dict_to)
+        self.assertIsInstance(diff, graphtage.DictNode)
+        self.assertGreater(diff.edited_cost(), 0)
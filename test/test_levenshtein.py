@@ -1,16 +1,34 @@
 import random
+from functools import lru_cache
 from typing import List
 from unittest import TestCase
+from unittest.mock import patch
 
 from tqdm import trange
 
 from graphtage.edits import Edit, Insert, Match, Remove
 from graphtage import EditDistance, string_edit_distance
+from graphtage.levenshtein import _levenshtein_distance, levenshtein_alignment, levenshtein_distance, \
+    LinearSpaceEditDistance
 
 
 LETTERS: str = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
 
 
+def reference_levenshtein_distance(s: str, t: str) -> int:
+    @lru_cache(maxsize=None)
+    def distance(i: int, j: int) -> int:
+        if i == 0 or j == 0:
+            return i + j
+        return min(
+            distance(i - 1, j) + 1,
+            distance(i, j - 1) + 1,
+            distance(i - 1, j - 1) + int(s[i - 1] != t[j - 1])
+        )
+
+    return distance(len(s), len(t))
+
+
 class TestEditDistance(TestCase):
     def test_string_edit_distance_reconstruction(self):
         for _ in trange(200):
@@ -72,3 +90,77 @@ class TestEditDistance(TestCase):
             3,
             sum(1 for _ in string_edit_distance('', 'foo').edits())
         )
+
+    def test_levenshtein_distance(self):
+        for distance in (levenshtein_distance, _levenshtein_distance):
+            self.assertEqual(0, distance('', ''))
+            self.assertEqual(3, distance('foo', ''))
+            self.assertEqual(3, distance('', 'foo'))
+            self.assertEqual(3, distance('kitten', 'sitting'))
+            for _ in trange(200):
+                str_from = ''.join(random.choices(LETTERS[:4], k=random.randint(0, 100)))
+                str_to = ''.join(random.choices(LETTERS[:4], k=random.randint(0, 100)))
+                self.assertEqual(reference_levenshtein_distance(str_from, str_to), distance(str_from, str_to))
+            for _ in trange(20):
+                list_from = random.choices(range(4), k=random.randint(65, 100))
+                list_to = random.choices(range(4), k=random.randint(65, 100))
+                self.assertEqual(reference_levenshtein_distance(list_from, list_to), distance(list_from, list_to))
+
+    def test_levenshtein_alignment(self):
+        for _ in trange(100):
+            str_from = ''.join(random.choices(LETTERS[:4], k=random.randint(0, 100)))
+            str_to = ''.join(random.choices(LETTERS[:4], k=random.randint(0, 100)))
+            alignment = list(levenshtein_alignment(str_from, str_to, max_matrix_size=16))
+            self.assertEqual(list(range(len(str_from))), [i for i, _ in alignment if i is not None])
+            self.assertEqual(list(range(len(str_to))), [j for _, j in alignment if j is not None])
+            cost = sum(1 for i, j in alignment if i is None or j is None or str_from[i] != str_to[j])
+            self.assertEqual(reference_levenshtein_distance(str_from, str_to), cost)
+
+    def test_linear_space_edit_distance(self):
+        for i in trange(60):
+            if i < 50:
+                max_length = 40
+            else:
+                # Also test strings long enough for the linear space edit to be used by default
+                max_length = 100
+            str_from = ''.join(random.choices(LETTERS[:4], k=random.randint(0, max_length)))
+            str_to = ''.join(random.choices(LETTERS[:4], k=random.randint(0, max_length)))
+            # Adjust the threshold so that both kinds of edit are constructed for the same strings
+            with patch('graphtage.graphtage.LINEAR_SPACE_STRING_EDIT_THRESHOLD', len(str_from) * len(str_to)):
+                distance = string_edit_distance(str_from, str_to)
+            with patch('graphtage.graphtage.LINEAR_SPACE_STRING_EDIT_THRESHOLD', -1):
+                linear_distance = string_edit_distance(str_from, str_to)
+            self.assertIsInstance(distance, EditDistance)
+            self.assertIsInstance(linear_distance, LinearSpaceEditDistance)
+            while distance.tighten_bounds():
+                pass
+            while linear_distance.tighten_bounds():
+                pass
+            self.assertEqual(distance.bounds(), linear_distance.bounds())
+            reconstructed_from = ''
+            reconstructed_to = ''
+            last_edit = None
+            for edit in linear_distance.edits():
+                if isinstance(edit, Match):
+                    self.assertEqual(edit.from_node, edit.to_node)
+                    reconstructed_from += edit.from_node.object
+                    reconstructed_to += edit.to_node.object
+                elif isinstance(edit, Remove):
+                    reconstructed_from += edit.from_node.object
+                elif isinstance(edit, Insert):
+                    # Like EditDistance, insertions are always printed before removals
+                    self.assertNotIsInstance(last_edit, Remove)
+                    reconstructed_to += edit.from_node.object
+                else:
+                    self.fail()
+                last_edit = edit
+            self.assertEqual(str_from, reconstructed_from)
+            self.assertEqual(str_to, reconstructed_to)
+            self.assertEqual(
+                linear_distance.bounds().upper_bound, sum(e.bounds().upper_bound for e in linear_distance.edits())
+            )
+            # Below MAX_EXACT_ALIGNMENT_SIZE, the very same edits are chosen as EditDistance
+            self.assertEqual(
+                [(type(edit), edit.from_node.object) for edit in distance.edits()],
+                [(type(edit), edit.from_node.object) for edit in linear_distance.edits()]
+            )
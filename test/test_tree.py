@@ -0,0 +1,82 @@
+import itertools
+import random
+import sys
+from typing import Iterator, List
+from unittest import TestCase
+
+from graphtage import IntegerNode, Match
+from graphtage.bounds import Range
+from graphtage.tree import CompoundEdit, Edit, explode_edits
+
+
+class NestedEdit(CompoundEdit):
+    def __init__(self, sub_edits: List[Edit]):
+        self.sub_edits: List[Edit] = sub_edits
+
+    def edits(self) -> Iterator[Edit]:
+        return iter(self.sub_edits)
+
+    def __iter__(self) -> Iterator[Edit]:
+        return self.edits()
+
+    def bounds(self) -> Range:
+        return Range(0, 0)
+
+    def tighten_bounds(self) -> bool:
+        return False
+
+    def is_complete(self) -> bool:
+        return True
+
+    @property
+    def valid(self) -> bool:
+        return True
+
+    @valid.setter
+    def valid(self, is_valid: bool):
+        pass
+
+
+def recursive_explode_edits(edit: Edit) -> Iterator[Edit]:
+    """The original, recursive implementation of :func:`graphtage.tree.explode_edits`"""
+    if isinstance(edit, CompoundEdit):
+        return itertools.chain(*map(recursive_explode_edits, edit.edits()))
+    else:
+        return iter((edit,))
+
+
+class TestTree(TestCase):
+    @staticmethod
+    def make_leaf_edit(value: int) -> Edit:
+        return Match(IntegerNode(value), IntegerNode(value), 0)
+
+    def make_random_edit(self, depth: int = 0) -> Edit:
+        if depth >= 4 or random.random() < 0.3:
+            return self.make_leaf_edit(random.randint(0, 1000))
+        return NestedEdit([self.make_random_edit(depth + 1) for _ in range(random.randint(0, 4))])
+
+    def test_explode_edits(self):
+        for _ in range(100):
+            edit = self.make_random_edit()
+            self.assertEqual(list(recursive_explode_edits(edit)), list(explode_edits(edit)))
+
+    def test_explode_deeply_nested_edits(self):
+        depth = sys.getrecursionlimit() + 100
+        # Every level has a leaf edit both before and after the next level
+        edit = self.make_leaf_edit(depth)
+        for level in reversed(range(depth)):
+            edit = NestedEdit([self.make_leaf_edit(level), edit, self.make_leaf_edit(-level - 1)])
+        exploded = list(explode_edits(edit))
+        old_limit = sys.getrecursionlimit()
+        # The recursive implementation needs a few stack frames per level:
+        sys.setrecursionlimit(old_limit + 4 * depth)
+        try:
+            expected = list(recursive_explode_edits(edit))
+        finally:
+            sys.setrecursionlimit(old_limit)
+        self.assertEqual(2 * depth + 1, len(exploded))
+        self.assertEqual(expected, exploded)
+        self.assertEqual(
+            list(range(depth + 1)) + list(range(-depth, 0)),
+            [e.from_node.object for e in exploded]
+        )